@@ -4,9 +4,11 @@ Code Generator Agent - generates Fleet-compliant environment from specification
 
 from ..core.base_agent import BaseAgent
 from ..core.llm_client import LLMClient
-from typing import Dict, Any
+from ..core.http_client import get_session
+from typing import Dict, Any, Optional
 import os
 import json
+import requests
 
 
 CODE_GENERATION_SYSTEM_PROMPT = """You are an expert full-stack developer specializing in Fleet environment creation.
@@ -95,6 +97,8 @@ db.pragma('foreign_keys = ON');
 - **Technology**: TypeScript + Express (standard stack)
 - **Proper error handling** - try/catch blocks around route handlers
 - **CORS enabled** - For cross-origin requests
+- **Response compression** - Use the `compression` middleware so large list payloads are sent gzipped (add `@types/compression` to devDependencies, or strict `tsc` fails with TS7016)
+- **ETags enabled** - Keep Express's default ETag support (do not call `app.set('etag', false)`) so clients can revalidate with 304s
 - **Real SQL queries** - No mocks! Actual database queries
 - **Routes organized by resource** - One file per resource in server/src/routes/
 - **Database access**: Use better-sqlite3 library
@@ -102,41 +106,291 @@ db.pragma('foreign_keys = ON');
 ### 3. MCP Server (Python)
 - **Python-based MCP server** in mcp/ directory
 - **Uses uv for dependency management** - pyproject.toml, not requirements.txt
+- **Dependencies**: `mcp>=1.10` (for `call_tool(validate_input=False)`), `httpx[http2]`, `async-lru>=2.0` (for `ttl`), orjson, `msgspec>=0.16` (for `msgspec.convert`), and `uvloop>=0.18; sys_platform != 'win32'` (server.py calls `uvloop.run`)
 - **Implements Model Context Protocol** for LLM interaction
 - **Fetches data from local server API** - http://localhost:{port}/api
 - **Environment variable handling**:
   - APP_ENV=local → fetches from http://localhost:{port}/api
   - APP_ENV=production → fetches from production API URL
 - **Basic tools**: get_all_resources, get_resource_by_id, search capabilities
+- **One pooled HTTP client per process** - Never open a new `httpx.AsyncClient` per request
+
+mcp/src/{app_name}_mcp/client.py MUST follow this pattern (`{resource}`/`{resources}` stand for each API resource):
+```python
+import asyncio
+import os
+import re
+from collections import OrderedDict
+from typing import Optional
+
+import httpx
+import orjson
+from async_lru import alru_cache
+
+# Resolved once at import; every client instance reuses these
+_APP_ENV = os.getenv("APP_ENV", "local")
+_DEFAULT_URL = "http://localhost:{port}" if _APP_ENV == "local" else "https://your-production-api.com"
+_BASE_URL = os.getenv("API_BASE_URL", _DEFAULT_URL)
+
+# Text fields scanned by free-text search, and list filters the API supports
+_SEARCH_FIELDS = ("name", "description")
+_SERVER_FILTERS = ("category",)
+
+# Same bound as the alru caches: at most this many bodies kept for ETag revalidation
+_ETAG_CACHE_SIZE = 512
+
+class APIError(Exception):
+    # Keeps the failed response's status, URL and body instead of a bare message
+    def __init__(self, status: int, url: str, body: str):
+        super().__init__(f"API request failed ({status}) {url}: {body}")
+        self.status = status
+        self.url = url
+        self.body = body
+
+class {AppName}APIClient:
+    def __init__(self):
+        self.base_url = _BASE_URL
+        self.api_url = _BASE_URL + "/api"
+        self.health_url = _BASE_URL + "/health"
+        # Reused for every request: keep-alive, HTTP/2 multiplexing, gzip by default
+        self._client = httpx.AsyncClient(
+            base_url=self.api_url,  # Paths are passed through as-is, no per-request joins
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            http2=True,
+        )
+        # (path, params) -> (ETag, parsed body) for conditional GETs, LRU-bounded
+        self._etags = OrderedDict()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        await self._client.aclose()
+
+    async def _request(self, method: str, path: str, **kwargs):
+        key = cached = None
+        if method == "GET":
+            # Revalidate with If-None-Match: unchanged data comes back as a bodiless 304
+            key = (path, frozenset((kwargs.get("params") or {}).items()))
+            cached = self._etags.get(key)
+            if cached:
+                self._etags.move_to_end(key)
+                kwargs["headers"] = {**(kwargs.get("headers") or {}), "If-None-Match": cached[0]}
+        response = await self._client.request(method, path, **kwargs)
+        if cached and response.status_code == 304:
+            return cached[1]
+        if response.is_error:
+            # Network errors and anything unexpected propagate with their own traceback
+            raise APIError(response.status_code, str(response.request.url), response.text[:500])
+        data = orjson.loads(response.content)
+        etag = response.headers.get("ETag")
+        if key and etag:
+            self._etags[key] = (etag, data)
+            self._etags.move_to_end(key)
+            if len(self._etags) > _ETAG_CACHE_SIZE:
+                self._etags.popitem(last=False)
+        return data
+
+    async def health_check(self):
+        # Absolute URL overrides base_url (health lives outside /api)
+        response = await self._client.get(self.health_url)
+        if response.is_error:
+            raise APIError(response.status_code, self.health_url, response.text[:500])
+        return orjson.loads(response.content)
+
+    # One block per resource. Idempotent GETs are memoized with a TTL
+    # (longer for data that rarely changes); call invalidate() after writes.
+    @alru_cache(maxsize=512, ttl=30)
+    async def get_{resource}(self, id: str):
+        return await self._request("GET", f"/{resources}/{id}")
+
+    async def list_{resources}(self, *, limit=20, offset=0, **filters):
+        # Sorted params tuple as the cache key, so keyword order never splits entries
+        params = {"limit": limit, "offset": offset, **filters}
+        return await self._list_{resources}(tuple(sorted(params.items())))
+
+    @alru_cache(maxsize=512, ttl=10)
+    async def _list_{resources}(self, params_key: tuple):
+        return await self._request("GET", "/{resources}", params=dict(params_key))
+
+    async def search_{resources}(self, query: str, limit: int = 10):
+        # "field:value" on a supported filter is answered by the server
+        field, _, value = query.partition(":")
+        if value and field in _SERVER_FILTERS:
+            return (await self.list_{resources}(**{field: value}, limit=limit))["data"]
+        # Free text: filter one shared cached page and stop at `limit`; the
+        # compiled case-insensitive pattern avoids lowercasing every field
+        pattern = re.compile(re.escape(query), re.IGNORECASE)
+        matching = []
+        for item in await self._fetch_recent_{resources}():
+            if any(pattern.search(item.get(f) or "") for f in _SEARCH_FIELDS):
+                matching.append(item)
+                if len(matching) >= limit:
+                    break
+        return matching
+
+    @alru_cache(maxsize=4, ttl=15)
+    async def _fetch_recent_{resources}(self, n: int = 50):
+        # Unfiltered page shared by every free-text search (cache key is n only)
+        return (await self._request("GET", "/{resources}", params={"limit": n}))["data"]
+
+    async def gather_limited(self, coros, concurrency: int = 10):
+        # Fan out over the shared pool with at most `concurrency` requests in flight
+        sem = asyncio.Semaphore(concurrency)
+
+        async def run(coro):
+            async with sem:
+                return await coro
+
+        return await asyncio.gather(*(run(coro) for coro in coros))
+
+    def invalidate(self):
+        # Drop all cached GET responses
+        for cached in (self.get_{resource}, self._list_{resources}, self._fetch_recent_{resources}):
+            cached.cache_clear()
+
+
+_client: Optional[{AppName}APIClient] = None
+
+def get_client() -> {AppName}APIClient:
+    # One pooled client per process, shared by every caller
+    global _client
+    if _client is None:
+        _client = {AppName}APIClient()
+    return _client
+```
 
 ### 4. MCP Server Protocol
-mcp/src/{app_name}_mcp/server.py MUST use this exact structure:
+mcp/src/{app_name}_mcp/server.py MUST follow this pattern:
 ```python
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
+from mcp import types
 import asyncio
+import msgspec
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+from .client import {AppName}APIClient, get_client
 
 app = Server("{app_name}-mcp")
+client: {AppName}APIClient | None = None  # Bound in main()
+
+def format_{resources}(items: list) -> str:
+    # Collect parts and join once (`text += ...` in a loop is quadratic);
+    # read each item's fields into locals once per iteration
+    parts = [f"Found {len(items)} results:\\n\\n"]
+    for item in items:
+        item_id, name, desc = item["id"], item["name"], item.get("description") or ""
+        parts.append(f"- **{name}** (id: {item_id}) {desc}\\n")
+    return "".join(parts)
+
+# Tool definitions never change: build them once at import, not per tools/list call.
+# They MUST be types.Tool objects - the SDK reads tool.name, plain dicts break tools/list and tools/call.
+_TOOLS_LIST = [
+    types.Tool(
+        name="list_{resources}",
+        description="List {resources}",
+        inputSchema={
+            "type": "object",
+            "properties": {"limit": {"type": "integer", "default": 20}, "offset": {"type": "integer", "default": 0}},
+        },
+    ),
+    # ... one entry per tool
+]
 
 @app.list_tools()
 async def list_tools():
-    return [{"name": "...", "description": "...", "inputSchema": {...}}]
+    return _TOOLS_LIST
+
+# One argument Struct (mirroring its inputSchema) and one async handler per tool
+class List{Resources}Args(msgspec.Struct):
+    limit: int = 20
+    offset: int = 0
+
+async def _handle_list_{resources}(args: List{Resources}Args):
+    result = await client.list_{resources}(limit=args.limit, offset=args.offset)
+    return [{"type": "text", "text": format_{resources}(result["data"])}]
 
-@app.call_tool()
+# Dispatch table, built once at import: adding a tool = one Struct, one handler, one entry
+TOOL_HANDLERS = {
+    "list_{resources}": (_handle_list_{resources}, List{Resources}Args),
+    # ... one entry per tool
+}
+
+# msgspec is the only validator: skip the SDK's per-call jsonschema check of the same arguments
+@app.call_tool(validate_input=False)
 async def call_tool(name: str, arguments: dict):
-    # Implementation
-    return [{"type": "text", "text": "result"}]
+    entry = TOOL_HANDLERS.get(name)
+    if entry is None:
+        return [{"type": "text", "text": f"Unknown tool: {name}"}]
+    handler, args_type = entry
+    try:
+        # Validates once and coerces types (e.g. "20" -> 20) before the handler runs
+        args = msgspec.convert(arguments or {}, args_type, strict=False)
+    except msgspec.ValidationError as e:
+        return [{"type": "text", "text": f"Invalid arguments for {name}: {str(e)}"}]
+    try:
+        return await handler(args)
+    except Exception as e:
+        return [{"type": "text", "text": f"Error: {str(e)}"}]
 
 async def main():
-    async with stdio_server() as (read_stream, write_stream):
-        # CRITICAL: Use create_initialization_options()!
-        await app.run(read_stream, write_stream, app.create_initialization_options())
+    global client
+    # The client closes its connection pool when the server shuts down
+    async with get_client() as api_client:
+        client = api_client
+        async with stdio_server() as (read_stream, write_stream):
+            # CRITICAL: Use create_initialization_options()!
+            await app.run(read_stream, write_stream, app.create_initialization_options())
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # libuv event loop when uvloop is installed, stdlib loop otherwise
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
 ```
 DO NOT use `get_capabilities(notification_options=None)` - it will fail!
 
+Worked example (RealWorld Conduit only - adapt the idea, not the names): when callers usually need related
+data, offer an opt-in flag in the tool's inputSchema (so callers can discover it) and fetch both concurrently:
+```python
+class GetArticleArgs(msgspec.Struct):
+    slug: str
+    include_comments: bool = False
+
+_TOOLS_LIST.append(types.Tool(
+    name="get_article",
+    description="Get an article by slug, optionally with its comments",
+    inputSchema={
+        "type": "object",
+        "properties": {"slug": {"type": "string"}, "include_comments": {"type": "boolean", "default": False}},
+        "required": ["slug"],
+    },
+))
+
+async def _handle_get_article(args: GetArticleArgs):
+    if args.include_comments:
+        article, comments = await asyncio.gather(
+            client.get_article(args.slug), client.get_article_comments(args.slug)
+        )
+        parts = [f"**{article['article']['title']}**\\n\\nComments:\\n"]
+        parts.extend(f"- {c['author']['username']}: {c['body']}\\n" for c in comments["comments"])
+        return [{"type": "text", "text": "".join(parts)}]
+    article = await client.get_article(args.slug)
+    return [{"type": "text", "text": f"**{article['article']['title']}**\\n\\n{article['article']['body']}"}]
+
+TOOL_HANDLERS["get_article"] = (_handle_get_article, GetArticleArgs)
+```
+
 ### 5. Monorepo Structure (pnpm workspace)
 - **Root pnpm-workspace.yaml** - MUST define ONLY Node.js packages: ["server"]
   - Do NOT include mcp/ (it's Python, not Node.js)
@@ -285,7 +539,7 @@ Auto-generate from the specification's endpoints list.
 7. Create Dockerfile for production (use pnpm@9.15.1, NOT 8.x!)
 8. Create .github/workflows/deploy.yml for CI/CD
 9. Create data/schema.sql with proper SQLite schema (NO CHECK constraints)
-10. Create server/package.json with dependencies (express, better-sqlite3, cors, typescript, tsx)
+10. Create server/package.json with dependencies (express, better-sqlite3, cors, compression, typescript, tsx) and devDependencies including @types/compression
 11. Create server/tsconfig.json
 12. Create server/src/lib/db.ts with DATABASE_PATH precedence logic
 13. Create server/src/routes/[resource].ts for each resource
@@ -417,9 +671,16 @@ The moment you see "success": true from validate_environment, your next action m
 class CodeGeneratorAgent(BaseAgent):
     """Agent that generates Fleet environment code from specification"""
 
-    def __init__(self, llm: LLMClient, output_dir: str, port: int = 3002):
+    def __init__(
+        self,
+        llm: LLMClient,
+        output_dir: str,
+        port: int = 3002,
+        session: Optional[requests.Session] = None
+    ):
         self.output_dir = output_dir
         self.port = port
+        self.session = session or get_session()
         self.generated_files = []
         self.specification = None  # Will be set during generate_code
 
@@ -846,18 +1107,18 @@ IMPORTANT: Do not call complete_generation until validate_environment returns su
 
             # Try to hit the health endpoint
             try:
-                import urllib.request
                 health_url = f"http://localhost:{self.port}/health"
-                req = urllib.request.Request(health_url)
-                with urllib.request.urlopen(req, timeout=3) as response:
-                    if response.status != 200:
-                        return {
-                            "success": False,
-                            "phase": "dev",
-                            "errors": f"Health check returned status {response.status}",
-                            "stdout": "",
-                            "message": f"❌ Health check failed with status {response.status}"
-                        }
+                response = self.session.get(health_url, timeout=3)
+                # 4xx/5xx raise here, so the except below attaches the dev server's output
+                response.raise_for_status()
+                if response.status_code != 200:
+                    return {
+                        "success": False,
+                        "phase": "dev",
+                        "errors": f"Health check returned status {response.status_code}",
+                        "stdout": "",
+                        "message": f"❌ Health check failed with status {response.status_code}"
+                    }
             except Exception as e:
                 # Try to capture any output from the process before reporting failure
                 try:
@@ -937,10 +1198,6 @@ IMPORTANT: Do not call complete_generation until validate_environment returns su
 
     def _validate_api_endpoints(self) -> Dict[str, Any]:
         """Validate API endpoints against specification"""
-        import urllib.request
-        import urllib.error
-        import json as json_module
-
         if not self.specification:
             return {"success": True, "message": "No specification to validate against"}
 
@@ -973,51 +1230,47 @@ IMPORTANT: Do not call complete_generation until validate_environment returns su
                     url = url.replace(':id', '1')
                     url = url.replace(':username', 'testuser')
 
-                    try:
-                        req = urllib.request.Request(url, method='GET')
-                        with urllib.request.urlopen(req, timeout=3) as response:
-                            status = response.status
-
-                            # Accept 200 (success) or 404 (resource doesn't exist, but endpoint works)
-                            # Reject 500 (server error)
-                            if status in [200, 404]:
-                                # Try to parse JSON response
-                                try:
-                                    body = response.read().decode('utf-8')
-                                    json_module.loads(body)
-                                    passed_tests.append({
-                                        "endpoint": f"{method} {path}",
-                                        "status": "✓",
-                                        "message": f"Returns {status} with valid JSON"
-                                    })
-                                except json_module.JSONDecodeError:
-                                    failed_tests.append({
-                                        "endpoint": f"{method} {path}",
-                                        "status": "✗",
-                                        "message": f"Returns {status} but invalid JSON"
-                                    })
-                            else:
-                                failed_tests.append({
-                                    "endpoint": f"{method} {path}",
-                                    "status": "✗",
-                                    "message": f"Unexpected status code: {status}"
-                                })
+                    # Reuses the pooled session instead of a new connection per endpoint
+                    response = self.session.get(url, timeout=3)
+                    status = response.status_code
 
-                    except urllib.error.HTTPError as e:
+                    if status >= 400:
                         # 404 is acceptable for parameterized routes with test data
                         # 401/403 means endpoint exists but needs auth
-                        if e.code in [404, 401, 403]:
+                        if status in [404, 401, 403]:
                             passed_tests.append({
                                 "endpoint": f"{method} {path}",
                                 "status": "✓",
-                                "message": f"Endpoint exists (returned {e.code})"
+                                "message": f"Endpoint exists (returned {status})"
                             })
                         else:
                             failed_tests.append({
                                 "endpoint": f"{method} {path}",
                                 "status": "✗",
-                                "message": f"HTTP error {e.code}: {str(e)}"
+                                "message": f"HTTP error {status}: {response.reason}"
                             })
+                    # Accept 200 (success); reject other non-error statuses
+                    elif status == 200:
+                        # Try to parse JSON response
+                        try:
+                            json.loads(response.text)
+                            passed_tests.append({
+                                "endpoint": f"{method} {path}",
+                                "status": "✓",
+                                "message": f"Returns {status} with valid JSON"
+                            })
+                        except json.JSONDecodeError:
+                            failed_tests.append({
+                                "endpoint": f"{method} {path}",
+                                "status": "✗",
+                                "message": f"Returns {status} but invalid JSON"
+                            })
+                    else:
+                        failed_tests.append({
+                            "endpoint": f"{method} {path}",
+                            "status": "✗",
+                            "message": f"Unexpected status code: {status}"
+                        })
 
             except Exception as e:
                 failed_tests.append({
@@ -2,6 +2,9 @@
 Exploration Agent - autonomously explores an API
 """
 
+import requests
+from typing import Optional
+
 from ..core.base_agent import BaseAgent
 from ..core.llm_client import LLMClient
 from ..tools.tool_executor import ToolExecutor
@@ -45,8 +48,14 @@ Remember: Be systematic and thorough. The quality of your exploration determines
 class ExplorationAgent(BaseAgent):
     """Agent that explores an API to understand its structure"""
 
-    def __init__(self, llm: LLMClient, target_url: str, max_iterations: int = 100):
-        self.executor = ToolExecutor(target_url)
+    def __init__(
+        self,
+        llm: LLMClient,
+        target_url: str,
+        max_iterations: int = 100,
+        session: Optional[requests.Session] = None
+    ):
+        self.executor = ToolExecutor(target_url, session=session)
 
         super().__init__(
             llm=llm,
@@ -4,6 +4,7 @@ Specification Ingestion Agent - parses formal specs into internal format
 
 from ..core.base_agent import BaseAgent
 from ..core.llm_client import LLMClient
+from ..core.http_client import get_session
 from typing import Dict, Any, Optional
 import json
 import requests
@@ -160,7 +161,9 @@ Response: { "article": { "id": 1, "title": "...", ... } }
 class SpecificationIngestionAgent(BaseAgent):
     """Agent that ingests formal specifications and converts to internal format"""
 
-    def __init__(self, llm: LLMClient):
+    def __init__(self, llm: LLMClient, session: Optional[requests.Session] = None):
+        self.session = session or get_session()
+
         # Define tools for spec ingestion
         tools = [
             {
@@ -267,7 +270,7 @@ class SpecificationIngestionAgent(BaseAgent):
 
         try:
             print(f"📥 Fetching spec from {url}...")
-            response = requests.get(url, timeout=30)
+            response = self.session.get(url, timeout=30)
             response.raise_for_status()
 
             content = response.text
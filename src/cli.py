@@ -10,12 +10,26 @@ import shutil
 from dotenv import load_dotenv
 
 from .core.llm_client import LLMClient
+from .core.http_client import get_session
 from .agents.exploration_agent import ExplorationAgent
 from .agents.specification_agent import SpecificationAgent
 from .agents.spec_ingestion_agent import SpecificationIngestionAgent
 from .agents.code_generator_agent import CodeGeneratorAgent
 
 
+BANNER_RULE = "=" * 70
+
+
+def write_lines(lines):
+    """Write a block of output lines with a single stdout write"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def banner(title):
+    """Lines for a phase banner"""
+    return ["", BANNER_RULE, title, BANNER_RULE, ""]
+
+
 def main():
     """Main CLI entry point"""
     load_dotenv()
@@ -59,6 +73,12 @@ def main():
         help="Port for the generated environment to run on (default: 3002)",
         default=3002
     )
+    parser.add_argument(
+        "--quiet",
+        "-q",
+        action="store_true",
+        help="Suppress banners and summaries (errors are still printed)"
+    )
 
     args = parser.parse_args()
 
@@ -72,6 +92,9 @@ def main():
     # Use higher max_tokens for spec ingestion (needs to generate large JSON)
     llm = LLMClient(api_key=api_key, max_tokens=8192)
 
+    # One pooled HTTP session shared by every agent in this process
+    session = get_session()
+
     # ========================================
     # BRANCH: from-spec vs clone/explore
     # ========================================
@@ -79,11 +102,10 @@ def main():
         # ========================================
         # PHASE 1: SPECIFICATION INGESTION
         # ========================================
-        print(f"\n{'='*70}")
-        print(f"📋 PHASE 1: SPECIFICATION INGESTION")
-        print(f"{'='*70}\n")
+        if not args.quiet:
+            write_lines(banner("📋 PHASE 1: SPECIFICATION INGESTION"))
 
-        ingestion_agent = SpecificationIngestionAgent(llm)
+        ingestion_agent = SpecificationIngestionAgent(llm, session=session)
         spec_result = ingestion_agent.ingest_spec(
             spec_source=args.target,
             source_type="auto"
@@ -99,45 +121,47 @@ def main():
         # ========================================
         # PHASE 1: EXPLORATION (for clone/explore)
         # ========================================
-        print(f"\n{'='*70}")
-        print(f"🔍 PHASE 1: AUTONOMOUS API EXPLORATION")
-        print(f"{'='*70}\n")
-
-        if args.endpoints:
-            print(f"📍 Starting endpoints: {', '.join(args.endpoints)}")
-        print(f"🔄 Max iterations: {args.max_iterations}\n")
+        if not args.quiet:
+            lines = banner("🔍 PHASE 1: AUTONOMOUS API EXPLORATION")
+            if args.endpoints:
+                lines.append(f"📍 Starting endpoints: {', '.join(args.endpoints)}")
+            lines.append(f"🔄 Max iterations: {args.max_iterations}\n")
+            write_lines(lines)
 
         exploration_agent = ExplorationAgent(
             llm,
             args.target,
-            max_iterations=args.max_iterations
+            max_iterations=args.max_iterations,
+            session=session
         )
         exploration_result = exploration_agent.explore(starting_endpoints=args.endpoints)
 
-        print(f"\n{'='*70}")
-        print(f"📊 EXPLORATION RESULTS")
-        print(f"{'='*70}\n")
-
-        print(f"✅ Success: {exploration_result['success']}")
-        print(f"🔄 Iterations: {exploration_result['iterations']}")
-        print(f"\n📝 Summary:\n{exploration_result['summary']}\n")
-
-        if exploration_result['observations']:
-            print(f"📋 Observations ({len(exploration_result['observations'])}):")
-            for i, obs in enumerate(exploration_result['observations'], 1):
-                print(f"  {i}. [{obs['category']}] {obs['observation']}")
+        if not args.quiet:
+            lines = banner("📊 EXPLORATION RESULTS")
+            lines.append(f"✅ Success: {exploration_result['success']}")
+            lines.append(f"🔄 Iterations: {exploration_result['iterations']}")
+            lines.append(f"\n📝 Summary:\n{exploration_result['summary']}\n")
+
+            observations = exploration_result['observations']
+            if observations:
+                lines.append(f"📋 Observations ({len(observations)}):")
+                lines.extend(
+                    f"  {i}. [{obs['category']}] {obs['observation']}"
+                    for i, obs in enumerate(observations, 1)
+                )
+            write_lines(lines)
 
         # If just exploring, stop here
         if args.command == "explore":
-            print()
+            if not args.quiet:
+                print()
             return
 
         # ========================================
         # PHASE 2: SPECIFICATION GENERATION
         # ========================================
-        print(f"\n{'='*70}")
-        print(f"📋 PHASE 2: SPECIFICATION GENERATION")
-        print(f"{'='*70}\n")
+        if not args.quiet:
+            write_lines(banner("📋 PHASE 2: SPECIFICATION GENERATION"))
 
         spec_agent = SpecificationAgent(llm)
         spec_result = spec_agent.generate_spec(
@@ -149,18 +173,20 @@ def main():
             print("❌ Failed to generate specification")
             sys.exit(1)
 
-        print("✅ Specification generated successfully!")
         spec = spec_result['specification']
-        print(f"   Endpoints: {len(spec.get('endpoints', []))}")
-        print(f"   Tables: {len(spec.get('database', {}).get('tables', []))}")
+        if not args.quiet:
+            write_lines([
+                "✅ Specification generated successfully!",
+                f"   Endpoints: {len(spec.get('endpoints', []))}",
+                f"   Tables: {len(spec.get('database', {}).get('tables', []))}"
+            ])
 
     # ========================================
     # CODE GENERATION (Phase 2 for from-spec, Phase 3 for clone)
     # ========================================
     phase_num = "2" if args.command == "from-spec" else "3"
-    print(f"\n{'='*70}")
-    print(f"⚡ PHASE {phase_num}: FLEET ENVIRONMENT GENERATION")
-    print(f"{'='*70}\n")
+    if not args.quiet:
+        write_lines(banner(f"⚡ PHASE {phase_num}: FLEET ENVIRONMENT GENERATION"))
 
     # Clean and create output directory
     output_dir = os.path.join(args.output, "cloned-env")
@@ -176,39 +202,47 @@ def main():
 
     # Create fresh output directory
     os.makedirs(output_dir, exist_ok=True)
-    print(f"📁 Output directory: {output_dir}")
-    print(f"🔌 Generated environment will run on port: {args.port}\n")
+    if not args.quiet:
+        write_lines([
+            f"📁 Output directory: {output_dir}",
+            f"🔌 Generated environment will run on port: {args.port}\n"
+        ])
 
-    code_agent = CodeGeneratorAgent(llm, output_dir, port=args.port)
+    code_agent = CodeGeneratorAgent(llm, output_dir, port=args.port, session=session)
     code_result = code_agent.generate_code(specification=spec)
 
     if not code_result['success']:
         print("❌ Failed to generate code")
         sys.exit(1)
 
-    print(f"\n✅ Code generation complete!")
-    print(f"   Generated {len(code_result['generated_files'])} files:")
-    for file in code_result['generated_files']:
-        print(f"   - {file}")
+    if args.quiet:
+        return
+
+    lines = [
+        "\n✅ Code generation complete!",
+        f"   Generated {len(code_result['generated_files'])} files:"
+    ]
+    lines.extend(f"   - {file}" for file in code_result['generated_files'])
 
     # ========================================
     # COMPLETE
     # ========================================
-    print(f"\n{'='*70}")
-    print(f"🎉 CLONING COMPLETE!")
-    print(f"{'='*70}\n")
-    print(f"📂 Fleet environment created at: {output_dir}")
-    print(f"✅ Environment validated and working!")
-    print(f"\n📝 To run the generated environment:")
-    print(f"   cd {output_dir}")
-    print(f"   pnpm run dev")
-    print(f"\n🔌 The API will be available at: http://localhost:{args.port}")
-    print(f"\n💡 The environment follows Fleet standards:")
-    print(f"   - Uses current.sqlite (auto-copied from seed.db)")
-    print(f"   - Supports DATABASE_PATH/ENV_DB_DIR environment variables")
-    print(f"   - Includes MCP server for LLM interaction")
-    print(f"   - Runs with mprocs for multi-process development")
-    print()
+    lines.extend(banner("🎉 CLONING COMPLETE!"))
+    lines.extend([
+        f"📂 Fleet environment created at: {output_dir}",
+        "✅ Environment validated and working!",
+        "\n📝 To run the generated environment:",
+        f"   cd {output_dir}",
+        "   pnpm run dev",
+        f"\n🔌 The API will be available at: http://localhost:{args.port}",
+        "\n💡 The environment follows Fleet standards:",
+        "   - Uses current.sqlite (auto-copied from seed.db)",
+        "   - Supports DATABASE_PATH/ENV_DB_DIR environment variables",
+        "   - Includes MCP server for LLM interaction",
+        "   - Runs with mprocs for multi-process development",
+        ""
+    ])
+    write_lines(lines)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,24 @@
+"""
+Shared HTTP session for agents that call external APIs
+"""
+
+import atexit
+import http.cookiejar
+from typing import Optional
+
+import requests
+
+
+_session: Optional[requests.Session] = None
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide pooled session, creating it on first use"""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        # Pool connections only: a stored Set-Cookie would silently authenticate
+        # later requests and skew what the agents observe about auth
+        _session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+        atexit.register(_session.close)
+    return _session
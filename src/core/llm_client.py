@@ -39,7 +39,13 @@ class LLMClient:
         }
 
         if system:
-            params["system"] = system
+            # The system prompt is identical on every iteration of an agent loop;
+            # mark it cacheable so repeat turns don't pay for it in full
+            params["system"] = [{
+                "type": "text",
+                "text": system,
+                "cache_control": {"type": "ephemeral"}
+            }]
 
         if tools:
             params["tools"] = tools
@@ -3,16 +3,20 @@ Tool executor - executes tools called by the agent
 """
 
 import requests
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from urllib.parse import urljoin
 
+from ..core.http_client import get_session
+
 
 class ToolExecutor:
     """Executes tools for agents"""
 
-    def __init__(self, target_url: str):
+    def __init__(self, target_url: str, session: Optional[requests.Session] = None):
         self.target_url = target_url
         self.observations = []
+        # Reuse connections to the target API across exploration requests
+        self.session = session or get_session()
 
     def execute(self, tool_name: str, tool_input: Dict[str, Any]) -> Any:
         """Execute a tool by name"""
@@ -36,13 +40,13 @@ class ToolExecutor:
 
         try:
             if method == "GET":
-                response = requests.get(url, headers=headers, timeout=10)
+                response = self.session.get(url, headers=headers, timeout=10)
             elif method == "POST":
-                response = requests.post(url, headers=headers, json=body, timeout=10)
+                response = self.session.post(url, headers=headers, json=body, timeout=10)
             elif method == "PUT":
-                response = requests.put(url, headers=headers, json=body, timeout=10)
+                response = self.session.put(url, headers=headers, json=body, timeout=10)
             elif method == "DELETE":
-                response = requests.delete(url, headers=headers, timeout=10)
+                response = self.session.delete(url, headers=headers, timeout=10)
             else:
                 return {"success": False, "error": f"Unsupported method: {method}"}
 